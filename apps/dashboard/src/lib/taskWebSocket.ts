@@ -1,7 +1,6 @@
 // WebSocket integration for task notifications
-import { wsMessages } from '$lib/websocket';
+import { addWSMessageCallback } from '$lib/websocket';
 import { toasts } from '$lib/stores/toasts';
-import { get } from 'svelte/store';
 
 interface TaskEventPayload {
   task?: {
@@ -24,7 +23,7 @@ interface TaskEventPayload {
   actor: string;
 }
 
-let lastProcessedTimestamp = 0;
+let initialized = false;
 let taskUpdateCallback: (() => void) | null = null;
 
 // Set callback for when tasks are updated (to refresh task list)
@@ -39,24 +38,13 @@ export function setCurrentUserId(userId: string | null) {
   currentUserId = userId;
 }
 
-// Process WebSocket messages and create toast notifications
+// Process WebSocket messages and create toast notifications.
+// Each message is handled once as it arrives, rather than re-scanning the
+// whole wsMessages store on every update to find the new ones.
 export function initTaskWebSocket() {
-  wsMessages.subscribe((messages) => {
-    if (messages.length === 0) return;
-
-    // Process only new messages (avoid duplicates on reconnect)
-    const newMessages = messages.filter(
-      (msg) => msg.timestamp && new Date(msg.timestamp).getTime() > lastProcessedTimestamp
-    );
-
-    if (newMessages.length > 0) {
-      lastProcessedTimestamp = new Date(newMessages[0].timestamp).getTime();
-    }
-
-    for (const message of newMessages) {
-      handleTaskEvent(message);
-    }
-  });
+  if (initialized) return;
+  initialized = true;
+  addWSMessageCallback(handleTaskEvent);
 }
 
 function handleTaskEvent(message: any) {
@@ -49,6 +49,8 @@ export interface OpenClawConfig {
 
 let cachedConfig: OpenClawConfig | null = null;
 let lastReadTime = 0;
+let pendingRead: Promise<OpenClawConfig> | null = null;
+let readGeneration = 0; // bumped by clearCache() so in-flight reads don't repopulate the cache
 const CACHE_TTL = 5000; // 5 seconds
 
 /**
@@ -62,16 +64,33 @@ export async function readConfig(): Promise<OpenClawConfig> {
   if (cachedConfig && (now - lastReadTime) < CACHE_TTL) {
     return cachedConfig;
   }
-  
-  try {
-    const data = await readFile(CONFIG_PATH, 'utf-8');
-    cachedConfig = JSON.parse(data);
-    lastReadTime = now;
-    return cachedConfig!;
-  } catch (err) {
-    console.error('[ConfigReader] Failed to read config:', err);
-    throw new Error('Failed to read OpenClaw configuration');
+
+  // Callers that miss the cache at the same time share one read,
+  // rather than each reading and parsing the file
+  if (pendingRead) {
+    return pendingRead;
   }
+
+  const generation = readGeneration;
+  const read = (async () => {
+    try {
+      const data = await readFile(CONFIG_PATH, 'utf-8');
+      const config: OpenClawConfig = JSON.parse(data);
+      if (generation === readGeneration) {
+        cachedConfig = config;
+        lastReadTime = now;
+      }
+      return config;
+    } catch (err) {
+      console.error('[ConfigReader] Failed to read config:', err);
+      throw new Error('Failed to read OpenClaw configuration');
+    } finally {
+      if (pendingRead === read) pendingRead = null;
+    }
+  })();
+  pendingRead = read;
+
+  return read;
 }
 
 /**
@@ -109,4 +128,6 @@ export async function getDefaultAgent(): Promise<AgentDefinition | null> {
 export function clearCache(): void {
   cachedConfig = null;
   lastReadTime = 0;
+  pendingRead = null;
+  readGeneration++;
 }
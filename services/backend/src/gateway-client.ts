@@ -10,6 +10,9 @@ const GATEWAY_URL = process.env.GATEWAY_URL || 'ws://127.0.0.1:18789';
 const GATEWAY_TOKEN = process.env.GATEWAY_TOKEN || '';
 const PROTOCOL_VERSION = 3;
 
+// High-frequency events emitted for every streamed chunk of agent output
+const STREAMING_EVENTS = new Set(['agent', 'chat']);
+
 export interface ApprovalRequest {
   id: string;
   expiresAtMs: number;
@@ -88,8 +91,11 @@ export class GatewayClient extends EventEmitter {
           
           // Handle events
           else if (msg.type === 'event') {
-            // Log all events for debugging
-            console.log('[GatewayClient] Received event:', msg.event, JSON.stringify(msg.payload, null, 2));
+            // Log events for debugging — except the per-token streaming ones, which
+            // would otherwise be re-serialised into the log on every delta
+            if (!STREAMING_EVENTS.has(msg.event)) {
+              console.log('[GatewayClient] Received event:', msg.event, JSON.stringify(msg.payload));
+            }
             this.handleEvent(msg.event, msg.payload);
           }
           
@@ -488,9 +488,33 @@ async function getSessionCostFromTranscript(sessionKey: string): Promise<{
 // completeTask removed — agents move their own tasks to review via API.
 // Stuck in-progress tasks are visible on the kanban board for manual triage.
 
+// CORS — only the dashboard's own origin(s) may make credentialed requests.
+// CORS_ORIGIN (comma-separated) overrides PUBLIC_URL / DASHBOARD_URL.
+const corsOrigins: Array<string | RegExp> = (
+  process.env.CORS_ORIGIN ||
+  [process.env.PUBLIC_URL, process.env.DASHBOARD_URL].filter(Boolean).join(',')
+)
+  .split(',')
+  .map((origin) => origin.trim().replace(/\/$/, ''))
+  .filter(Boolean);
+
+if (process.env.NODE_ENV !== 'production') {
+  // Vite dev server on localhost or the PUBLIC_URL host (see apps/dashboard/src/lib/config.ts).
+  // Other LAN hosts must be listed in CORS_ORIGIN explicitly.
+  const devHosts = ['localhost', '127\\.0\\.0\\.1'];
+  if (process.env.PUBLIC_URL) {
+    try {
+      devHosts.push(new URL(process.env.PUBLIC_URL).hostname.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+    } catch {
+      // Invalid PUBLIC_URL — ignore
+    }
+  }
+  corsOrigins.push(new RegExp(`^https?://(${devHosts.join('|')}):517[34]$`));
+}
+
 // Plugins
 await fastify.register(cors, {
-  origin: true,
+  origin: corsOrigins,
   credentials: true,
 });
 
@@ -506,7 +530,10 @@ await fastify.register(session, {
   saveUninitialized: false,
 });
 
-await fastify.register(websocket);
+// permessage-deflate: activity streams and chat deltas are verbose JSON and compress well
+await fastify.register(websocket, {
+  options: { perMessageDeflate: true },
+});
 
 // Auth middleware - protect all /api/* routes except health and auth
 // Set DISABLE_AUTH=true for local development (skips all auth checks)
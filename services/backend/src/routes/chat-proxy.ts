@@ -108,7 +108,8 @@ export async function chatProxyRoutes(fastify: FastifyInstance) {
 
       const gw = new WebSocket(GATEWAY_URL);
       let handshakeDone = false;
-      const pendingMessages: string[] = [];
+      // Raw client frames queued until the handshake completes (forwarded as-is, no re-encoding)
+      const pendingMessages: Array<{ data: Buffer; isBinary: boolean }> = [];
 
       function forwardToClient(raw: string) {
         if (socket.readyState === WebSocket.OPEN) socket.send(raw);
@@ -124,7 +125,14 @@ export async function chatProxyRoutes(fastify: FastifyInstance) {
         console.log('[ChatProxy] Gateway WS open — waiting for connect.challenge...');
       });
 
-      gw.on('message', (rawData: Buffer | string) => {
+      gw.on('message', (rawData: Buffer, isBinary: boolean) => {
+        // Once the handshake is done the proxy is a pure relay — no need to
+        // parse every streamed event just to forward it unchanged
+        if (handshakeDone) {
+          if (socket.readyState === WebSocket.OPEN) socket.send(rawData, { binary: isBinary });
+          return;
+        }
+
         const raw = rawData.toString();
         let msg: any;
         try { msg = JSON.parse(raw); } catch { forwardToClient(raw); return; }
@@ -206,7 +214,7 @@ export async function chatProxyRoutes(fastify: FastifyInstance) {
 
             // Flush queued client messages
             for (const pending of pendingMessages) {
-              if (gw.readyState === WebSocket.OPEN) gw.send(pending);
+              if (gw.readyState === WebSocket.OPEN) gw.send(pending.data, { binary: pending.isBinary });
             }
             pendingMessages.length = 0;
 
@@ -237,12 +245,13 @@ export async function chatProxyRoutes(fastify: FastifyInstance) {
 
       // ── Dashboard client events ─────────────────────────────────────────
 
-      socket.on('message', (raw: Buffer | string) => {
-        const msgStr = raw.toString();
+      // Forward the received buffer directly — decoding to a string and letting ws
+      // re-encode it would copy every frame twice for no benefit
+      socket.on('message', (data: Buffer, isBinary: boolean) => {
         if (handshakeDone && gw.readyState === WebSocket.OPEN) {
-          gw.send(msgStr);
+          gw.send(data, { binary: isBinary });
         } else if (!handshakeDone) {
-          pendingMessages.push(msgStr);
+          pendingMessages.push({ data, isBinary });
         }
       });
 
@@ -1,8 +1,10 @@
 import { FastifyInstance } from 'fastify';
-import { promises as fs } from 'fs';
+import { promises as fs, createWriteStream } from 'fs';
 import { join, basename, extname } from 'path';
 import { execFile } from 'child_process';
 import { promisify } from 'util';
+import { pipeline } from 'stream/promises';
+import { randomUUID } from 'crypto';
 
 const execFileAsync = promisify(execFile);
 const WORKSPACE_PATH = join(process.env.HOME || '', '.openclaw/workspace');
@@ -122,12 +124,19 @@ export async function projectFilesRoutes(fastify: FastifyInstance) {
           continue;
         }
 
-        // Buffer and write the file
-        const chunks: Buffer[] = [];
-        for await (const chunk of part.file) chunks.push(chunk);
-        const data = Buffer.concat(chunks);
-
-        await fs.writeFile(destPath, data);
+        // Stream the file to disk instead of collecting chunks and concatenating
+        // them, which held up to two full copies of each upload in memory.
+        // Write to a temp file and rename on success so an aborted or oversized
+        // upload never clobbers an existing file with a partial one.
+        const tmpPath = `${destPath}.upload-${randomUUID()}`;
+        const out = createWriteStream(tmpPath);
+        try {
+          await pipeline(part.file, out);
+          await fs.rename(tmpPath, destPath);
+        } catch (err) {
+          await fs.unlink(tmpPath).catch(() => {});
+          throw err;
+        }
 
         let extracted = false;
 
@@ -141,7 +150,7 @@ export async function projectFilesRoutes(fastify: FastifyInstance) {
           }
         }
 
-        uploaded.push({ name: safeName, size: data.length, extracted });
+        uploaded.push({ name: safeName, size: out.bytesWritten, extracted });
       }
 
       if (uploaded.length === 0) {
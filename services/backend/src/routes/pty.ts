@@ -45,10 +45,12 @@ export async function ptyRoutes(fastify: FastifyInstance) {
 
         console.log(`[PTY] Spawned PID ${ptyProcess.pid}`);
 
-        // PTY output → browser
+        // PTY output → browser as raw binary frames. Wrapping it in JSON would
+        // escape every control character (\x1b → \u001b) on the busiest path;
+        // JSON frames are kept for control messages (exit, error) only.
         ptyProcess.onData((data: string) => {
           if (socket.readyState === WebSocket.OPEN) {
-            socket.send(JSON.stringify({ type: 'output', data }));
+            socket.send(Buffer.from(data, 'utf8'));
           }
         });
 